@@ -29,7 +29,6 @@ the scene to render
 """
 
 import math
-import sys
 import os
 import re
 from collections import namedtuple
@@ -45,6 +44,7 @@ import FreeCADGui as Gui
 
 from Render.constants import TEMPLATEDIR, PARAMS, FCDVERSION
 from Render.rdrhandler import RendererHandler, RendererNotFoundError
+from Render import rendermaterial
 from Render.rdrexecutor import RendererExecutor, RendererWorker, ExporterWorker
 from Render.utils import (
     translate,
@@ -449,7 +449,9 @@ class Project(FeatureBase):
         defaultcam = _get_default_cam(renderer, self.fpo)
 
         # Get objects rendering strings (including lights, cameras...)
-        objstrings = self._get_objstrings(renderer)
+        # (in an export pass, so that materials caches are scoped to it)
+        with rendermaterial.export_pass():
+            objstrings = self._get_objstrings(renderer)
 
         # Instantiate template: merge all strings (cam, objects, ground
         # plane...) into rendering template
@@ -580,12 +582,16 @@ class Project(FeatureBase):
 
         This method is a (private) subroutine of `render` method.
 
+        Args:
+            template -- the instantiated template, as a list of strings
+            directory -- the directory where to write the file
+
         Returns path to temp file.
         """
         _, suffix = os.path.splitext(self.fpo.Template)
         fpath = os.path.join(directory, self.fpo.Name + suffix)
         with open(fpath, "w", encoding="utf8") as fobj:
-            fobj.write(template)
+            fobj.writelines(template)
         return fpath
 
     def _get_rendering_params(self):
@@ -662,19 +668,30 @@ def _instantiate_template(template, objstrings, defaultcam):
     """Instantiate template (merge all objects into template).
 
     This function is a (private) subroutine of `render` method.
+
+    Returns a list of strings, to be written in sequence: objects strings are
+    not concatenated into one single (possibly huge) string.
     """
-    renderobjs = "\n".join(objstrings)
+    # Objects strings, separated by newlines
+    renderobjs = [x for s in objstrings for x in (s, "\n")][:-1]
 
     if "RaytracingCamera" in template:
-        template = re.sub("(.*RaytracingCamera.*)", defaultcam, template)
-        template = re.sub("(.*RaytracingContent.*)", renderobjs, template)
+        pattern = "(.*RaytracingCamera.*)|(.*RaytracingContent.*)"
+        contents = ([defaultcam], renderobjs)
     else:
-        content = defaultcam + "\n" + renderobjs
-        template = re.sub("(.*RaytracingContent.*)", content, template)
-
-    version_major = sys.version_info.major
-
-    return template.encode("utf8") if version_major < 3 else template
+        pattern = "(.*RaytracingContent.*)"
+        contents = ([defaultcam, "\n"] + renderobjs,)
+
+    # Split template around tokens lines, and insert contents in place
+    parts = []
+    pos = 0
+    for match in re.finditer(pattern, template):
+        parts.append(template[pos : match.start()])
+        parts.extend(contents[match.lastindex - 1])
+        pos = match.end()
+    parts.append(template[pos:])
+
+    return parts
 
 
 class RenderingError(Exception):
@@ -613,10 +613,12 @@ def _get_rends_from_window(obj, name, material, mesher, **kwargs):
     # Subobjects colors
     transparency_boost = kwargs.get("transparency_boost", 0)
     faces_len = [len(s.Faces) for s in obj.Shape.Solids]
-    if obj.ViewObject is not None:  # Gui is up
+    vobj = obj.ViewObject
+    if vobj is not None:  # Gui is up
+        diffuse_colors = vobj.DiffuseColor  # Fetch the whole list only once
         colors = [
             _boost_tp(
-                RGB.from_fcd_rgba(obj.ViewObject.DiffuseColor[i]),
+                RGB.from_fcd_rgba(diffuse_colors[i]),
                 transparency_boost,
             )
             for i in itertools.accumulate([0] + faces_len[:-1])
@@ -60,9 +60,10 @@ def write_mesh(name, mesh, material):
     # Minimal material support
     color = material.default_color
 
-    points = [f"{v.x} {v.y} {v.z}" for v in mesh.Topology[0]]
+    topo_points, topo_facets = mesh.Topology  # Topology is rebuilt per access
+    points = [f"{v.x} {v.y} {v.z}" for v in topo_points]
     norms = [f"{n.x} {n.y} {n.z}" for n in mesh.getPointNormals()]
-    tris = [f"{t[0]} {t[1]} {t[2]}" for t in mesh.Topology[1]]
+    tris = [f"{t[0]} {t[1]} {t[2]}" for t in topo_facets]
 
     snippet = """
     # Generated by FreeCAD (http://www.freecadweb.org/)
@@ -695,7 +695,7 @@ def _write_material_mixed(name, matval):
     submat_d = matval.getmixedsubmat("diffuse", name + "_diffuse")
     snippet_d_tex = submat_d.write_textures()
 
-    transparency = matval.material.mixed.transparency
+    transparency = matval.material.getshaderparam("Transparency")
     assert isinstance(transparency, float)
 
     snippet_mix = f"""
@@ -48,6 +48,8 @@ import math
 
 import FreeCAD as App
 
+from Render.constants import PARAMS
+
 from .utils.misc import fovy_to_fovx
 
 
@@ -55,6 +57,10 @@ TEMPLATE_FILTER = "Povray templates (povray_*.pov)"
 
 mimetypes.init()
 
+# Width and height command line arguments
+_RE_ARG_W = re.compile(r"\+W[0-9]+")
+_RE_ARG_H = re.compile(r"\+H[0-9]+")
+
 
 # ===========================================================================
 #                             Write functions
@@ -183,15 +189,14 @@ def write_arealight(
     color = color.to_linear()
 
     # Prepare shape points for 'look_like'
-    points = [
-        (+axis1 + axis2) / 2,
-        (+axis1 - axis2) / 2,
-        (-axis1 - axis2) / 2,
-        (-axis1 + axis2) / 2,
-        (+axis1 + axis2) / 2,
-    ]
-    points = [f"<{p.x},{p.z},{p.y}>" for p in points]
-    points = ", ".join(points)
+    # (closed polygon: p1, p2, -p1, -p2, p1)
+    pt1 = (axis1 + axis2) / 2
+    pt2 = (axis1 - axis2) / 2
+    points = (
+        f"<{pt1.x},{pt1.z},{pt1.y}>, <{pt2.x},{pt2.z},{pt2.y}>, "
+        f"<{-pt1.x},{-pt1.z},{-pt1.y}>, <{-pt2.x},{-pt2.z},{-pt2.y}>, "
+        f"<{pt1.x},{pt1.z},{pt1.y}>"
+    )
 
     factor = power / 100
 
@@ -518,21 +523,21 @@ def _write_material_fallback(name, material):
 
     Fallback material is a simple Diffuse material.
     """
+    # pylint: disable=unused-argument
     try:
         lcol = material.default_color.to_linear()
-        red = float(lcol[0])
-        grn = float(lcol[1])
-        blu = float(lcol[2])
-        assert (0 <= red <= 1) and (0 <= grn <= 1) and (0 <= blu <= 1)
-    except (AttributeError, ValueError, TypeError, AssertionError):
+        red = min(1.0, max(0.0, float(lcol[0])))
+        grn = min(1.0, max(0.0, float(lcol[1])))
+        blu = min(1.0, max(0.0, float(lcol[2])))
+    except (AttributeError, ValueError, TypeError):
         red, grn, blu = 1, 1, 1
-    snippet = """    texture {{
-        pigment {{rgb <{r}, {g}, {b}>}}
+    snippet = f"""    texture {{
+        pigment {{rgb <{red}, {grn}, {blu}>}}
         finish {{
             diffuse albedo 1
             }}
         }}"""
-    return snippet.format(n=name, r=red, g=grn, b=blu)
+    return snippet
 
 
 def _write_material_emission(name, matval):  # pylint: disable=unused-argument
@@ -577,14 +582,21 @@ IMAGE_MIMETYPES = {
     "image/tiff": "tiff",
 }  # Povray claims to support also iff and sys, but I don't know those formats
 
+# File extension to Povray image type (computed from MIME types)
+_EXT_TO_IMAGETYPE = {
+    ext: imagetype
+    for mimetype, imagetype in IMAGE_MIMETYPES.items()
+    for ext in mimetypes.guess_all_extensions(mimetype)
+}
+
 
 def _imagetype(path):
     """Compute Povray image type, for image_map.
 
-    Type is computed with MIME.
+    Type is computed from file extension, with MIME.
     """
-    mimetype = mimetypes.guess_type(path)
-    return IMAGE_MIMETYPES.get(mimetype[0], "")
+    ext = os.path.splitext(path)[1].lower()
+    return _EXT_TO_IMAGETYPE.get(ext, "")
 
 
 def _texname(**kwargs):
@@ -605,6 +617,12 @@ def _texname(**kwargs):
     return name
 
 
+# Texture-capable property types, unsupported texture properties and gammas
+_TEX_PROPTYPES = frozenset(("RGB", "RGBA", "texonly", "texscalar"))
+_UNSUPPORTED_TEX_PROPS = frozenset(("normal", "displacement"))
+_GAMMA_MAP = {"RGB": "srgb"}
+
+
 def _write_texture(**kwargs):
     """Compute a string in renderer SDL to describe a texture.
 
@@ -633,14 +651,14 @@ def _write_texture(**kwargs):
     texname = _texname(**kwargs)
 
     # Just a few property types are supported by POV-Ray...
-    if proptype not in ["RGB", "RGBA", "texonly", "texscalar"]:
+    if proptype not in _TEX_PROPTYPES:
         # There will be a warning in write_texref
         return texname, ""
 
     # Compute gamma
-    gamma = "srgb" if proptype == "RGB" else 1.0
+    gamma = _GAMMA_MAP.get(proptype, 1.0)
 
-    if propname in ["normal", "displacement"]:
+    if propname in _UNSUPPORTED_TEX_PROPS:
         msg = (
             f"[Render] [Povray] [Object '{objname[:-1]}'] "
             f"[Shader '{shadertype}'] [Parameter '{propname}'] - "
@@ -694,13 +712,13 @@ pigment {{
     return texname, snippet
 
 
-VALSNIPPETS = {
-    "RGB": "color red {val[0]}  green {val[1]}  blue {val[2]}",
-    "float": "{val}",
-    "node": "",
-    "RGBA": "{val.r} {val.g} {val.b} {val.a}",
-    "texonly": "{val}",
-    "str": "{val}",
+_VAL_FORMATTERS = {
+    "RGB": lambda val: f"color red {val[0]}  green {val[1]}  blue {val[2]}",
+    "float": str,
+    "node": lambda val: "",
+    "RGBA": lambda val: f"{val.r} {val.g} {val.b} {val.a}",
+    "texonly": str,
+    "str": str,
 }
 
 
@@ -725,8 +743,7 @@ def _write_value(**kwargs):
         propvalue = propvalue.to_linear()
 
     # Snippets for values
-    snippet = VALSNIPPETS[proptype]
-    value = snippet.format(val=propvalue)
+    value = _VAL_FORMATTERS[proptype](propvalue)
 
     # Special case
     if shadertype in ["Glass", "glass"] and propname == "color":
@@ -755,7 +772,7 @@ def _write_texref(**kwargs):
 
     # Just a few property types are supported by POV-Ray...
     # For the others, warn and take fallback
-    if proptype not in ["RGB", "RGBA", "texonly", "texscalar"]:
+    if proptype not in _TEX_PROPTYPES:
         fallback = (
             propvalue.fallback if propvalue.fallback is not None else 0.5
         )
@@ -769,7 +786,7 @@ def _write_texref(**kwargs):
         return fallback
 
     # Unsupported features...
-    if propname in ["normal", "displacement"]:
+    if propname in _UNSUPPORTED_TEX_PROPS:
         return ""  # Not supported by Povray
 
     # Compute texture name
@@ -791,8 +808,7 @@ def test_cmdline(_):
 
     This function allows to test if renderer settings (path...) are correct
     """
-    params = App.ParamGet("User parameter:BaseApp/Preferences/Mod/Render")
-    rpath = params.GetString("PovRayPath", "")
+    rpath = PARAMS.GetString("PovRayPath", "")
     return [rpath, "--help"]
 
 
@@ -801,6 +817,25 @@ def test_cmdline(_):
 # ===========================================================================
 
 
+def _quote_path(path):
+    """Quote a path for a renderer command line.
+
+    Command is split with shlex before being run, so a path containing spaces
+    must be quoted. A path already quoted by the user (in preferences) is not
+    quoted twice.
+
+    Args:
+        path -- the path to quote (str)
+
+    Returns:
+        The quoted path (str)
+    """
+    path = path.strip()
+    if len(path) >= 2 and path[0] == path[-1] and path[0] in "\"'":
+        path = path[1:-1]
+    return f'"{path}"'
+
+
 def render(
     project,
     prefix,
@@ -831,13 +866,11 @@ def render(
         The command to run renderer (string)
         A path to output image file (string)
     """
-    params = App.ParamGet("User parameter:BaseApp/Preferences/Mod/Render")
-
-    prefix = params.GetString("Prefix", "")
+    prefix = PARAMS.GetString("Prefix", "")
     if prefix:
         prefix += " "
 
-    rpath = params.GetString("PovRayPath", "")
+    rpath = PARAMS.GetString("PovRayPath", "")
     if not rpath:
         App.Console.PrintError(
             "Unable to locate renderer executable. "
@@ -847,17 +880,18 @@ def render(
         return None, None
 
     # Prepare command line parameters
-    args = params.GetString("PovRayParameters", "")
+    args = PARAMS.GetString("PovRayParameters", "")
     if args:
         args += " "
-    if "+W" in args:
-        args = re.sub(r"\+W[0-9]+", f"+W{width}", args)
-    else:
+    # (skip regex substitution if argument is already set to the right value)
+    if "+W" not in args:
         args += f"+W{width} "
-    if "+H" in args:
-        args = re.sub(r"\+H[0-9]+", f"+H{height}", args)
-    else:
+    elif args.count("+W") > 1 or f"+W{width} " not in args:
+        args = _RE_ARG_W.sub(f"+W{width}", args)
+    if "+H" not in args:
         args += f"+H{height} "
+    elif args.count("+H") > 1 or f"+H{height} " not in args:
+        args = _RE_ARG_H.sub(f"+H{height}", args)
     args += "-D " if batch else "+D "
     if output_file:
         args += f"""+O"{output_file}" """
@@ -873,7 +907,7 @@ def render(
 
     filepath = f'"{input_file}"'
 
-    cmd = prefix + rpath + " " + args + " " + filepath
+    cmd = prefix + _quote_path(rpath) + " " + args + " " + filepath
 
     output = (
         output_file
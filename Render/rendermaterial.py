@@ -30,11 +30,18 @@
 
 
 import collections
-import types
+import contextlib
 import functools
+import hashlib
+import itertools
+import io
+import operator
+import types
 import uuid
 import re
 import os.path
+import threading
+import weakref
 
 import FreeCAD as App
 
@@ -148,11 +155,66 @@ STD_MATERIALS_PARAMETERS = {
 STD_MATERIALS = sorted(list(STD_MATERIALS_PARAMETERS.keys()))
 
 
+@functools.lru_cache(maxsize=32)
+def _render_prefix(name):
+    """Get material card keys prefix for a renderer or a shader type."""
+    return f"Render.{name}."
+
+
+# Standard materials parameters, laid out as parallel tuples for each shader
+# type (names, types, defaults and material card keys), for fast lookup
+ParamArrays = collections.namedtuple(
+    "ParamArrays", "names types defaults keys"
+)
+STD_MATERIALS_SOA = {
+    shadertype: ParamArrays(
+        tuple(p.name for p in params),
+        tuple(p.type for p in params),
+        tuple(p.default for p in params),
+        tuple(_render_prefix(shadertype) + p.name for p in params),
+    )
+    for shadertype, params in STD_MATERIALS_PARAMETERS.items()
+}
+
+
+def _build_partypes(params):
+    """Build parameter types table from a list of parameters (P).
+
+    Parameter types are keyed by the last element of parameter name. Compound
+    names also record their nodes (and the 'shader' entry of the nodes).
+    """
+    res = {}
+    for param in params:
+        *nodes, key = param.name.lower().split(".")
+        for node in nodes:
+            res[node] = "node"
+            res["shader"] = "str"
+        res[key] = param.type
+    return types.MappingProxyType(res)
+
+
+# Parameter types, shared by all RenderMaterial of a given shader type
+# (read-only: a material departing from them gets its own copy)
+_PARTYPES_BY_SHADER = {
+    shadertype: _build_partypes(params)
+    for shadertype, params in STD_MATERIALS_PARAMETERS.items()
+}
+_PARTYPES_BY_SHADER["Passthrough"] = types.MappingProxyType(
+    {"string": "str", "renderer": "str", "default_color": "RGBA"}
+)
+_NO_PARTYPES = types.MappingProxyType({})
+
+
 # ===========================================================================
 #                  RenderMaterial generation (Main entry point)
 # ===========================================================================
 
 
+# Rendering materials computed during the current export pass
+# (filled only during a pass, and emptied by 'clear_cache' at its boundaries)
+_RENDERING_MATERIALS = {}
+
+
 def get_rendering_material(meshname, material, renderer, default_color):
     """Get render material (Render.RenderMaterial) from FreeCAD material.
 
@@ -196,20 +258,67 @@ def get_rendering_material(meshname, material, renderer, default_color):
         )
         return RenderMaterial.build_fallback(default_color, doc=None)
 
+    # Read-only usage of the card: no need to copy, FreeCAD already returns a
+    # fresh dict
+    mat = material.Material
+    renderer = str(renderer)
+
+    # Outside an export pass, do not memoize
+    if not _EXPORT_PASS.is_set():
+        return _get_rendering_material(
+            meshname, material, mat, renderer, default_color
+        )
+
+    # Look for a material already computed during this export pass
+    # (material card content is part of the key, so that any modification of
+    # the card invalidates the cached entry)
+    key = (
+        material.Document.Name,
+        material.Name,
+        tuple(sorted(mat.items())),
+        renderer,
+        tuple(default_color.to_srgb()),
+    )
+    try:
+        return _RENDERING_MATERIALS[key]
+    except KeyError:
+        pass
+
+    res = _get_rendering_material(
+        meshname, material, mat, renderer, default_color
+    )
+    _RENDERING_MATERIALS[key] = res
+    return res
+
+
+def _get_rendering_material(meshname, material, mat, renderer, default_color):
+    """Get render material from FreeCAD material (worker).
+
+    This function is the worker of 'get_rendering_material', which memoizes
+    its results: materials shared by several objects are computed only once
+    per export pass.
+
+    Parameters:
+    meshname -- the name of the mesh the material is computed for
+    material -- a valid FreeCAD material
+    mat -- the material card of 'material' (dict)
+    renderer -- the targeted renderer (string, case sensitive)
+    default_color -- a RGB color, to be used as a fallback
+    """
     doc = material.Document
 
     # Initialize
-    mat = dict(material.Material)
-    renderer = str(renderer)
     name = mat.get("Name", "<Unnamed Material>")
     debug = functools.partial(ru_debug, "Material", f"'{meshname}' {name}")
 
     debug("Starting material computation")
 
     # Try renderer Passthrough
-    common_keys = passthrough_keys(renderer) & mat.keys()
+    common_keys = passthrough_keys(renderer, mat.keys())
     if common_keys:
-        lines = tuple(mat[k] for k in sorted(common_keys))
+        lines = operator.itemgetter(*common_keys)(mat)
+        if len(common_keys) == 1:
+            lines = (lines,)  # itemgetter returns a scalar for a single key
         debug("Found valid Passthrough - returning")
         return RenderMaterial.build_passthrough(
             lines, renderer, default_color, doc, material.Proxy.get_textures()
@@ -219,50 +328,44 @@ def get_rendering_material(meshname, material, renderer, default_color):
     shadertype = mat.get("Render.Type", None)
     if shadertype:
         try:
-            params = STD_MATERIALS_PARAMETERS[shadertype]
+            params = STD_MATERIALS_SOA[shadertype]
         except KeyError:
             debug(f"Unknown material type '{shadertype}'")
         else:
             values = tuple(
-                (
-                    p.name,  # Pareter name
-                    mat.get(f"Render.{shadertype}.{p.name}", None),  # Par val
-                    p.default,  # Pareter default value
-                    p.type,  # Pareter type
-                    default_color,  # Object color
+                zip(
+                    params.names,  # Parameter names
+                    map(mat.get, params.keys),  # Parameter values
+                    params.defaults,  # Parameter default values
+                    params.types,  # Parameter types
+                    itertools.repeat(default_color),  # Object color
                 )
-                for p in params
             )
-            res = RenderMaterial.build_standard(shadertype, values, doc)
+            casts = _STD_MATERIALS_CASTS[shadertype]
+            res = RenderMaterial.build_standard(shadertype, values, doc, casts)
             return res
 
     # Climb up to Father
     debug("No valid material definition - trying father material")
-    try:
-        father_name = mat["Father"]
-        assert father_name
-        materials = (
-            o for o in App.ActiveDocument.Objects if is_valid_material(o)
-        )
-        father = next(
-            m for m in materials if m.Material.get("Name", "") == father_name
-        )
-    except (KeyError, AssertionError):
+    father_name = mat.get("Father")
+    if not father_name:
         # No father
         debug("No valid father")
-    except StopIteration:
-        # Found father, but not in document
-        msg = (
-            "Found father material name ('{}') but "
-            "did not find this material in active document"
-        )
-        debug(msg.format(father_name))
     else:
-        # Found usable father
-        debug(f"Retrieve father material '{father_name}'")
-        return get_rendering_material(
-            meshname, father, renderer, default_color
-        )
+        father = _find_material(App.ActiveDocument.Name, father_name)
+        if father is None:
+            # Found father, but not in document
+            msg = (
+                "Found father material name ('{}') but "
+                "did not find this material in active document"
+            )
+            debug(msg.format(father_name))
+        else:
+            # Found usable father
+            debug(f"Retrieve father material '{father_name}'")
+            return get_rendering_material(
+                meshname, father, renderer, default_color
+            )
 
     # Try with Coin-like parameters (backward compatibility)
     try:
@@ -279,6 +382,58 @@ def get_rendering_material(meshname, material, renderer, default_color):
     return RenderMaterial.build_fallback(default_color, doc)
 
 
+def _find_material(docname, name):
+    """Find a valid material in a document, by its card name.
+
+    The lookup goes through the document index. If the index does not give a
+    material with the requested name (material added or renamed since the
+    index was built), the index is rebuilt before concluding.
+
+    Args:
+        docname -- the name of the document to search
+        name -- the card name of the material to find
+
+    Returns:
+        The material object, or None if not found
+    """
+    # Outside an export pass, do not memoize
+    if not _EXPORT_PASS.is_set():
+        return _index_materials_by_name(docname).get(name)
+
+    res = _materials_by_name(docname).get(name)
+    if res is None or res.Material.get("Name", "") != name:
+        _materials_by_name.cache_clear()
+        res = _materials_by_name(docname).get(name)
+    return res
+
+
+@functools.lru_cache(maxsize=4)
+def _materials_by_name(docname):
+    """Index the valid materials of a document by their card name (cached).
+
+    The index is built once per export pass (emptied by 'clear_cache').
+    """
+    return _index_materials_by_name(docname)
+
+
+def _index_materials_by_name(docname):
+    """Index the valid materials of a document by their card name.
+
+    If several materials share the same name, the first one is retained.
+
+    Args:
+        docname -- the name of the document to index
+
+    Returns:
+        A dictionary {material card name: material object}
+    """
+    res = {}
+    for obj in App.getDocument(docname).Objects:
+        if is_valid_material(obj):
+            res.setdefault(obj.Material.get("Name", ""), obj)
+    return res
+
+
 # ===========================================================================
 #                             Objects for renderers
 # ===========================================================================
@@ -294,15 +449,53 @@ class RenderMaterial:
     necessary conversions from FreeCAD colors (srgb) are made here.
     """
 
+    __slots__ = (
+        "shadertype",
+        "shadername",
+        "shader",
+        "shaderproperties",
+        "default_color",
+        "_partypes",
+        "doc",
+        "passthrough_texture",
+        "__weakref__",
+    )
+
     # Factory methods (static)
 
     @staticmethod
-    def build_standard(shadertype, values, doc):
-        """Build standard material."""
+    def build_standard(shadertype, values, doc, casts=None):
+        """Build standard material.
+
+        shadertype -- the type of shader
+        values -- a sequence of (name, value, default, type, objcolor)
+        doc -- document for texture searching
+        casts -- the cast functions to apply to values (optional, resolved
+          from values types if None)
+        """
+        # Look for an identical material already built
+        key = (
+            shadertype,
+            getattr(doc, "Name", None),
+            tuple(tuple(map(_hashable, v)) for v in values),
+        )
+        res = _INTERNED_MATERIALS.get(key)
+        if res is not None:
+            return res
+
+        res = RenderMaterial._build_standard(shadertype, values, doc, casts)
+        _INTERNED_MATERIALS[key] = res
+        return res
+
+    @staticmethod
+    def _build_standard(shadertype, values, doc, casts=None):
+        """Build standard material, without interning (see build_standard)."""
         res = RenderMaterial(shadertype, doc)
 
-        for nam, val, dft, typ, objcol in values:
-            cast_function = _CAST_FUNCTIONS[typ]
+        if casts is None:
+            casts = [_CAST_FUNCTIONS[v[3]] for v in values]
+
+        for (nam, val, dft, typ, objcol), cast_function in zip(values, casts):
             try:
                 value = cast_function(val, doc, objcol)
             except (TypeError, ValueError):
@@ -314,24 +507,13 @@ class RenderMaterial:
         # material.
         par = STD_MATERIALS_PARAMETERS[shadertype][0]
         res.default_color = res.getshaderparam(par.name)
+
         return res
 
     @staticmethod
     def build_passthrough(lines, renderer, default_color, doc, textures):
         """Build passthrough material."""
-        res = RenderMaterial("Passthrough", doc)
-
-        # pylint: disable=protected-access
-
-        # The main parameter is the string containing the passthrough
-        res.shader.string = _convert_passthru("\n".join(lines))
-        res._partypes["string"] = "str"
-
-        res.shader.renderer = renderer
-        res._partypes["renderer"] = "str"
-
-        res.default_color = default_color
-        res._partypes["default_color"] = "RGBA"
+        source = "\n".join(lines)
 
         # We also need to register textures
         # in case they would be referenced by the material
@@ -358,13 +540,46 @@ class RenderMaterial:
         try:
             texture = textures[0]
         except IndexError:
-            res.passthrough_texture = {}
+            passthrough_texture = {}
         else:
-            res.passthrough_texture = {
+            passthrough_texture = {
                 propname: _tex_get_value(propname, texture)
                 for propname in texture.PropertiesList
             }
 
+        # Look for an identical material already built
+        # (key on a digest of the source, rather than on the source itself,
+        # and on texture values, so that texture edits are taken into account)
+        digest = hashlib.blake2b(source.encode(), digest_size=16).digest()
+        key = (
+            "Passthrough",
+            getattr(doc, "Name", None),
+            digest,
+            renderer,
+            _hashable(default_color),
+            # (some texture properties are not hashable: use repr)
+            tuple((k, repr(v)) for k, v in passthrough_texture.items()),
+        )
+        res = _INTERNED_MATERIALS.get(key)
+        if res is not None:
+            return res
+
+        res = RenderMaterial("Passthrough", doc)
+
+        # pylint: disable=protected-access
+
+        # The main parameter is the string containing the passthrough
+        passthru = _convert_passthru(source, digest)
+        res.setshaderparam("string", passthru, "str")
+
+        res.setshaderparam("renderer", renderer, "str")
+
+        res.default_color = default_color
+        res._set_partype("default_color", "RGBA")
+
+        res.passthrough_texture = passthrough_texture
+
+        _INTERNED_MATERIALS[key] = res
         return res
 
     @staticmethod
@@ -374,17 +589,23 @@ class RenderMaterial:
         color -- a RGB color
         doc -- document for texture searching
         """
-        _alpha = color.alpha
+        # Look for a fallback already built for this color
+        key = ("Fallback", getattr(doc, "Name", None), _hashable(color))
+        res = _INTERNED_MATERIALS.get(key)
+        if res is not None:
+            return res
+
+        alpha = color.alpha  # Already a float
 
         # A simpler approach would have been to rely only on mixed material but
         # it leads to a lot of materials definitions in output files which
         # hinders the proper functioning of most of the renderers, so we
         # implement a more selective operation.
-        if float(_alpha) == 1.0:
+        if alpha == 1.0:
             # Build diffuse
             shadertype = "Diffuse"
             values = (("Color", color, color, "RGB", color),)
-        elif float(_alpha) == 0.0:
+        elif alpha == 0.0:
             # Build glass
             shadertype = "Glass"
             values = (
@@ -394,7 +615,7 @@ class RenderMaterial:
         else:
             # Build mixed
             shadertype = "Mixed"
-            _trsparency = str(1.0 - float(_alpha))
+            _trsparency = str(1.0 - alpha)
             values = (
                 ("Diffuse.Color", color, color, "RGB", color),
                 ("Glass.IOR", "1.5", "1.5", "float", color),
@@ -402,7 +623,10 @@ class RenderMaterial:
                 ("Transparency", _trsparency, _trsparency, "float", color),
             )
 
-        return RenderMaterial.build_standard(shadertype, values, doc)
+        # (interned on the fallback key only: no need to key on values)
+        res = RenderMaterial._build_standard(shadertype, values, doc)
+        _INTERNED_MATERIALS[key] = res
+        return res
 
     # Instance methods
 
@@ -410,15 +634,22 @@ class RenderMaterial:
         """Initialize object."""
         shadertype = str(shadertype)
         self.shadertype = shadertype
-        setattr(self, shadertype.lower(), types.SimpleNamespace())
+        self.shadername = shadertype.lower()
+        # Shader parameters, as a dictionary (shaderproperties is an alias)
+        self.shader = self.shaderproperties = {}
         self.default_color = WHITE
-        self._partypes = {}  # Record parameter types
+        # Record parameter types (shared table, copied on write)
+        self._partypes = _PARTYPES_BY_SHADER.get(shadertype, _NO_PARTYPES)
         self.doc = doc  # Source document, for textures
         self.passthrough_texture = {}
 
     def __repr__(self):
         """Represent object."""
-        items = (f"{k}={v!r}" for k, v in self.__dict__.items())
+        items = (
+            f"{k}={getattr(self, k)!r}"
+            for k in self.__slots__
+            if not k.startswith("__")
+        )
         return f"{type(self).__name__}({', '.join(items)})"
 
     def setshaderparam(self, name, value, paramtype=None):
@@ -432,36 +663,56 @@ class RenderMaterial:
 
         If parameter does not exist, add it.
         If parameter name is a compound like 'foo.bar.baz', foo and bar are
-        added as SimpleNamespaces.
+        added as sub-dictionaries.
         """
+        # Fast path: simple (non-compound) name
+        if "." not in name:
+            key = name.lower()
+            self.shader[key] = value
+            self._set_partype(key, paramtype)
+            return
+
         # Break down parameter path
-        path = [e.lower() for e in [self.shadertype] + name.split(".")]
-
-        # Find parameter position (and create sub-namespaces if necessary)
-        pos = self
-        for elem in path[:-1]:  # Except last subname
-            if not hasattr(pos, elem):
-                setattr(pos, elem, types.SimpleNamespace())
-                self._partypes[elem] = "node"
-                setattr(pos, "shader", elem)
-                self._partypes["shader"] = "str"
-            pos = getattr(pos, elem)
+        *nodes, key = name.lower().split(".")
+
+        # Find parameter position (and create sub-nodes if necessary)
+        pos = self.shader
+        for elem in nodes:
+            if elem not in pos:
+                pos[elem] = {}
+                self._set_partype(elem, "node")
+                pos["shader"] = elem
+                self._set_partype("shader", "str")
+            pos = pos[elem]
 
         # Set parameter value
-        setattr(pos, path[-1], value)
+        pos[key] = value
 
         # Record parameter type
-        self._partypes[path[-1]] = paramtype
+        self._set_partype(key, paramtype)
+
+    def _set_partype(self, key, paramtype):
+        """Record parameter type.
+
+        Types tables are shared between materials of same shader type, so the
+        table is copied before the first write that would alter it.
+        """
+        partypes = self._partypes
+        if key in partypes and partypes[key] == paramtype:
+            return
+        if isinstance(partypes, types.MappingProxyType):
+            partypes = self._partypes = dict(partypes)
+        partypes[key] = paramtype
 
     def getmixedsubmat(self, subname, nodename="mixed"):
         """Build a RenderMaterial from a mixed submaterial."""
+        if nodename != self.shadername:
+            raise AttributeError(f"No '{nodename}' node in material")
         res = RenderMaterial(
             subname, self.doc
         )  # Resulting RenderMat to be returned
         # Copy submat into result
-        node = getattr(self, nodename)
-        submatsrc = getattr(node, subname)
-        setattr(res, subname, submatsrc)
+        res.shader = res.shaderproperties = self.shader[subname]
 
         # Initialize _partypes
         res._partypes = self._partypes  # pylint: disable=protected-access
@@ -472,31 +723,18 @@ class RenderMaterial:
         """Get shader parameter.
 
         If parameter name is a compound like 'foo.bar.baz', the method
-        retrieves self.foo.bar.baz .
-        If one of the path element is missing in self, an AttributeError will
-        be raised.
+        retrieves shader['foo']['bar']['baz'] .
+        If one of the path element is missing in shader, an AttributeError
+        will be raised.
         """
-        path = [e.lower() for e in [self.shadertype] + name.split(".")]
-        res = self
-        for elem in path:
-            res = getattr(res, elem)
+        res = self.shader
+        try:
+            for elem in name.lower().split("."):
+                res = res[elem]
+        except (KeyError, TypeError) as err:
+            raise AttributeError(f"No '{name}' parameter in shader") from err
         return res
 
-    @property
-    def shadername(self):
-        """Get shader name."""
-        return self.shadertype.lower()
-
-    @property
-    def shader(self):
-        """Get shader attribute, whatever underlying attribute it is."""
-        return getattr(self, self.shadername)
-
-    @property
-    def shaderproperties(self):
-        """Get shader's properties, as a dictionary."""
-        return self.shader.__dict__
-
     def get_param_type(self, param_name):
         """Get parameter type."""
         return self._partypes[param_name]
@@ -533,10 +771,27 @@ class RenderMaterial:
     def has_textures(self):
         """Check if this material has textures."""
         return any(
-            hasattr(p, "is_texture") for p in self.shaderproperties.values()
+            isinstance(p, RenderTexture)
+            for p in self.shaderproperties.values()
         )
 
 
+# Materials already built, indexed by their (hashable) inputs.
+# Identical materials are shared as long as they are referenced somewhere,
+# within one export pass (emptied by 'clear_cache', at the beginning of each
+# pass, as texture objects referenced by inputs may have been modified)
+_INTERNED_MATERIALS = weakref.WeakValueDictionary()
+
+
+def _hashable(value):
+    """Get a hashable representation of a material input value (helper).
+
+    RGB colors are not hashable by value, so they are replaced by their
+    components.
+    """
+    return tuple(value.to_srgb()) if isinstance(value, RGB) else value
+
+
 Directories = collections.namedtuple("Directories", "project object")
 WriteFunctions = collections.namedtuple(
     "WriteFunctions", "texture value texref"
@@ -559,6 +814,20 @@ class MaterialValues:
       underlying value.
     """
 
+    __slots__ = (
+        "material",
+        "shader",
+        "objname",
+        "parent_shadertype",
+        "_values",
+        "_textures",
+        "_texobjects",
+        "_write_functions",
+        "_directories",
+        "_unique_matname",
+        "passthrough_texture",
+    )
+
     def __init__(
         self,
         objname,
@@ -605,64 +874,72 @@ class MaterialValues:
             else inherited_unique_name
         )
 
-        # Build values and textures - loop on shader properties
-        for propkey, propvalue in material.shaderproperties.items():
-            # None value: not handled, continue
-            if propvalue is None:
-                continue
+        # Hoist loop invariants
+        partypes = material._partypes
+        shadertype = material.shadertype
+        unique_matname = self._unique_matname
 
-            # Get property type
-            proptype = material.get_param_type(propkey)
+        # Gather shader properties (None values are not handled)
+        props = [
+            (propkey, propvalue, partypes[propkey])
+            for propkey, propvalue in material.shaderproperties.items()
+            if propvalue is not None
+        ]
 
-            # Is it a texture?
-            if hasattr(propvalue, "is_texture"):
-                # Compute texture
-                texname, texture = self._write_functions.texture(
+        # Compute textures (write functions expect keyword arguments)
+        texnames = {}
+        for propkey, propvalue, proptype in props:
+            if isinstance(propvalue, RenderTexture):
+                texname, texture = write_texture_fun(
                     objname=objname,
                     propname=propkey,
                     proptype=proptype,
                     propvalue=propvalue,
-                    shadertype=material.shadertype,
-                    parent_shadertype=self.parent_shadertype,
-                    unique_matname=self._unique_matname,
-                    project_directory=self._directories.project,
-                    object_directory=self._directories.object,
+                    shadertype=shadertype,
+                    parent_shadertype=parent_shadertype,
+                    unique_matname=unique_matname,
+                    project_directory=project_directory,
+                    object_directory=object_directory,
                 )
+                texnames[propkey] = texname
                 # Add texture SDL to internal list of textures
                 self._textures.append(texture)
-                value = self._write_functions.texref(
+                # Add texture object to internal list (for Appleseed)
+                self._texobjects[propkey] = propvalue
+
+        # Compute values: either reference to texture or plain value
+        self._values = {
+            propkey: (
+                write_texref_fun(
                     objname=objname,
-                    texname=texname,
+                    texname=texnames[propkey],
                     propname=propkey,
                     proptype=proptype,
                     propvalue=propvalue,
-                    shadertype=material.shadertype,
-                    parent_shadertype=self.parent_shadertype,
-                    unique_matname=self._unique_matname,
+                    shadertype=shadertype,
+                    parent_shadertype=parent_shadertype,
+                    unique_matname=unique_matname,
                     matval=self,
                 )
-                # Add texture object to internal list (for Appleseed)
-                self._texobjects[propkey] = propvalue
-            else:
-                # Not a texture, treat as plain value...
-                value = write_value_fun(
+                if propkey in texnames
+                else write_value_fun(
                     objname=objname,
                     propname=propkey,
                     proptype=proptype,
                     propvalue=propvalue,
-                    shadertype=material.shadertype,
-                    parent_shadertype=self.parent_shadertype,
-                    unique_matname=self._unique_matname,
+                    shadertype=shadertype,
+                    parent_shadertype=parent_shadertype,
+                    unique_matname=unique_matname,
                     matval=self,
                 )
+            )
+            for propkey, propvalue, proptype in props
+        }
 
-            # Store resulting value
-            self._values[propkey] = value
-
-            # Special case: passthrough. We store all the textures in a
-            # dedicated field, to make them available for the material
-            if material.shadertype == "Passthrough":
-                self.passthrough_texture = material.passthrough_texture
+        # Special case: passthrough. We store all the textures in a
+        # dedicated field, to make them available for the material
+        if shadertype == "Passthrough":
+            self.passthrough_texture = material.passthrough_texture
 
     @property
     def textures(self):
@@ -702,7 +979,7 @@ class MaterialValues:
 
     def has_bump(self):
         """Check if material has a bump texture (boolean)."""
-        return ("bump" in self._values) and (self._values["bump"] is not None)
+        return self._values.get("bump") is not None
 
     def get_bump_factor(self):
         """Get bump factor, default to 1.0 if non-existing."""
@@ -724,20 +1001,16 @@ class MaterialValues:
 
     def has_normal(self):
         """Check if material has a normal texture (boolean)."""
-        return ("normal" in self._values) and (
-            self._values["normal"] is not None
-        )
+        return self._values.get("normal") is not None
 
     def has_displacement(self):
         """Check if material has a normal texture (boolean)."""
-        return ("displacement" in self._values) and (
-            self._values["displacement"] is not None
-        )
+        return self._values.get("displacement") is not None
 
     def is_texture(self, prop):
         """Check if property returns a texture (boolean)."""
         propvalue = self.material.shaderproperties[prop]
-        return hasattr(propvalue, "is_texture")
+        return isinstance(propvalue, RenderTexture)
 
     @property
     def default_color(self):
@@ -791,7 +1064,22 @@ RenderTexture.__new__.__defaults__ = (None,) * 2  # Python 3.6 style
 # ===========================================================================
 
 
-def _castrgb(*args):
+def _is_single_field(value):
+    """Check whether a material card value has a single field (helper)."""
+    return ";" not in value and '"' not in value and "\n" not in value
+
+
+def _parse_fields(value):
+    """Parse a material card value into a list of fields (helper to cast).
+
+    Most values have a single field: for those, csv parsing is skipped.
+    """
+    if _is_single_field(value):
+        return [value] if value else []
+    return parse_csv_str(value)
+
+
+def _castrgb(value, doc, objcol=None):
     """Cast extended RGB field value to RGB object or RenderTexture object.
 
     This function can handle "object color" special case:
@@ -807,83 +1095,74 @@ def _castrgb(*args):
         a RGB object containing the targeted color **or** a RenderTexture
         object if appliable.
     """
-    value = str(args[0])
-    doc = args[1]
-    objcol = args[2]
+    # Already a color (fallback materials): copy, no need to format and parse
+    if isinstance(value, RGB):
+        return RGB(value.to_srgb())
+
+    value = str(value)
+
+    # Plain color: no need to parse
+    if (
+        _is_single_field(value)
+        and "Texture" not in value
+        and "Object" not in value
+    ):
+        return RGB.from_string(value)
 
-    parsed = parse_csv_str(value)
+    parsed = _parse_fields(value)
 
-    if "Object" in parsed:
+    if parsed and parsed[0] == "Object":
         return objcol
 
-    if "Texture" in parsed:
+    if parsed and parsed[0] == "Texture":
         # Build RenderTexture
         imageid = str2imageid(parsed[1])
-        texobject = doc.getObject(imageid.texture)  # Texture object
-        file = texobject.getPropertyByName(imageid.image)
         try:
             fallback = RGB.from_string(parsed[2])
         except (IndexError, ValueError):
             fallback = None
-        res = RenderTexture(
-            texobject.Label,
-            imageid.image,
-            file,
-            texobject.Rotation.getValueAs("deg"),
-            float(texobject.Scale),
-            texobject.TranslationU.getValueAs("m"),
-            texobject.TranslationV.getValueAs("m"),
-            fallback,
-        )
-        return res
+        return _make_rendertexture(imageid, doc, fallback=fallback)
 
     # Default (and fallback) case, return color
     return RGB.from_string(parsed[0])
 
 
-def _castfloat(*args):
+def _castfloat(value, doc, objcol=None):
     """Cast extended float field value to float or RenderTexture object.
 
     Args:
         value -- the value to parse and cast
+        doc -- the doc where to search textures
 
     Returns:
         a float containing the targeted value **or** a RenderTexture object
         if appliable.
     """
-    value = args[0]
-    doc = args[1]
+    # pylint: disable=unused-argument
+    value = str(value)
+
+    # Plain float: no need to parse
+    if _is_single_field(value) and "Texture" not in value:
+        return float(value) if value else 0.0
 
     # Parse value
-    parsed = parse_csv_str(str(value))
+    parsed = _parse_fields(value)
 
-    if "Texture" in parsed:
+    if parsed and parsed[0] == "Texture":
         # Build RenderTexture
         imageid = str2imageid(parsed[1])
-        texobject = doc.getObject(imageid.texture)  # Texture object
-        file = texobject.getPropertyByName(imageid.image)
         try:
             fallback = float(parsed[2])
         except (IndexError, ValueError):
             fallback = None
-        res = RenderTexture(
-            texobject.Label,
-            imageid.image,
-            file,
-            texobject.Rotation.getValueAs("deg"),
-            float(texobject.Scale),
-            texobject.TranslationU.getValueAs("m"),
-            texobject.TranslationV.getValueAs("m"),
-            fallback,
-        )
-        return res
+        return _make_rendertexture(imageid, doc, fallback=fallback)
 
     # Default (and fallback) case, return float
     value = parsed[0]
     return float(value) if value else 0.0
 
 
-def _caststr(*args):
+def _caststr(value, doc, objcol=None):
     """Cast to string value.
 
     Args:
@@ -892,41 +1171,75 @@ def _caststr(*args):
     Returns:
         The cast string value.
     """
-    value = str(args[0])
-    return value
+    # pylint: disable=unused-argument
+    return str(value)
 
 
-def _make_rendertexture(imageid, doc, scalar=None):
-    """Make a RenderTexture from an ImageId (helper to cast)."""
-    texobject = doc.getObject(imageid.texture)  # Texture object
-    file = texobject.getPropertyByName(imageid.image)
-    res = RenderTexture(
-        name=texobject.Label,
-        subname=imageid.image,
-        file=file,
-        rotation=texobject.Rotation.getValueAs("deg"),
-        scale=float(texobject.Scale),
-        translation_u=texobject.TranslationU.getValueAs("m"),
-        translation_v=texobject.TranslationV.getValueAs("m"),
-        fallback=None,
-        scalar=scalar,
-    )
+# Textures data read during the current export pass
+# (filled only during a pass, and emptied by 'clear_cache' at its boundaries,
+# as texture objects may have been modified since last export)
+_TEXTURES_DATA = {}
+
+
+def _get_texture_data(docname, texname, imagename):
+    """Get the data of a texture image, for RenderTexture (cached).
+
+    During an export pass, texture object is read once.
+
+    Args:
+        docname -- the name of the document containing the texture
+        texname -- the name of the texture object
+        imagename -- the name of the image property in the texture object
+
+    Returns:
+        A dictionary of RenderTexture fields
+    """
+    key = (docname, texname, imagename)
+    try:
+        return _TEXTURES_DATA[key]
+    except KeyError:
+        pass
+
+    texobject = App.getDocument(docname).getObject(texname)
+    res = {
+        "name": texobject.Label,
+        "subname": imagename,
+        "file": texobject.getPropertyByName(imagename),
+        "rotation": texobject.Rotation.getValueAs("deg"),
+        "scale": float(texobject.Scale),
+        "translation_u": texobject.TranslationU.getValueAs("m"),
+        "translation_v": texobject.TranslationV.getValueAs("m"),
+    }
+    # Outside an export pass, do not memoize
+    if _EXPORT_PASS.is_set():
+        _TEXTURES_DATA[key] = res
     return res
 
 
-def _casttexonly(*args):
+def _make_rendertexture(imageid, doc, scalar=None, fallback=None):
+    """Make a RenderTexture from an ImageId (helper to cast)."""
+    texdata = _get_texture_data(doc.Name, imageid.texture, imageid.image)
+    return RenderTexture(**texdata, fallback=fallback, scalar=scalar)
+
+
+def _casttexonly(value, doc, objcol=None):
     """Cast to texonly value.
 
     Args:
         value -- the value to cast
+        doc -- the doc where to search textures
 
     Returns:
         The cast string value.
     """
-    value = args[0]
+    # pylint: disable=unused-argument
     value = str(value)
-    doc = args[1]
-    parsed = parse_csv_str(value)
+
+    # No texture: no need to parse
+    if "Texture" not in value:
+        return None
+
+    parsed = _parse_fields(value)
 
     if parsed and parsed[0] == "Texture":
         # Build RenderTexture
@@ -937,19 +1250,24 @@ def _casttexonly(*args):
     return None
 
 
-def _casttexscalar(*args):
+def _casttexscalar(value, doc, objcol=None):
     """Cast to texture and scalar.
 
     Args:
         value -- the value to cast
+        doc -- the doc where to search textures
 
     Returns:
         The cast string value.
     """
-    value = args[0]
+    # pylint: disable=unused-argument
     value = str(value)
-    doc = args[1]
-    parsed = parse_csv_str(value)
+
+    # No texture: no need to parse
+    if "Texture" not in value:
+        return None
+
+    parsed = _parse_fields(value)
 
     if parsed and parsed[0] == "Texture":
         # Build RenderTexture
@@ -968,27 +1286,62 @@ _CAST_FUNCTIONS = {
     "texscalar": _casttexscalar,
 }
 
+# Cast functions of standard materials parameters, resolved once for each
+# shader type (parallel to STD_MATERIALS_SOA)
+_STD_MATERIALS_CASTS = {
+    shadertype: tuple(_CAST_FUNCTIONS[t] for t in params.types)
+    for shadertype, params in STD_MATERIALS_SOA.items()
+}
+
+
+_PASSTHRU_REPLACED_TOKENS = {
+    "{": "{{",
+    "}": "}}",
+    "%NAME%": "{n}",
+    "%RED%": "{c[0]}",
+    "%GREEN%": "{c[1]}",
+    "%BLUE%": "{c[2]}",
+}
 
-_PASSTHRU_REPLACED_TOKENS = (
-    (r"{", r"{{"),
-    (r"}", r"}}"),
-    (r"%NAME%", r"{n}"),
-    (r"%RED%", r"{c[0]}"),
-    (r"%GREEN%", r"{c[1]}"),
-    (r"%BLUE%", r"{c[2]}"),
-    (r"%TEXTURE\((.*)\)%", r"{tex[\1]}"),
+# Plain passthrough tokens, in a single pattern
+_PASSTHRU_TOKENS_RE = re.compile(
+    "|".join(re.escape(t) for t in _PASSTHRU_REPLACED_TOKENS)
 )
+_PASSTHRU_TEXTURE_RE = re.compile(r"%TEXTURE\((.*)\)%")
+
 
+def _replace_passthru_token(match):
+    """Get replacement string for a plain passthrough token (helper)."""
+    return _PASSTHRU_REPLACED_TOKENS[match.group(0)]
 
-def _convert_passthru(passthru):
+
+# Passthrough strings converted during the current export pass, indexed by a
+# digest of their source (filled only during a pass, and emptied by
+# 'clear_cache' at its boundaries)
+_CONVERTED_PASSTHRU = {}
+
+
+def _convert_passthru(passthru, digest):
     """Convert a passthrough string from FCMat format to Python FSML.
 
     (FSML stands for Format Specification Mini-Language)
+
+    During an export pass, a given source is converted once.
+
+    Args:
+        passthru -- the passthrough string to convert
+        digest -- a digest of 'passthru', used as cache key
     """
-    for pattern, replace in _PASSTHRU_REPLACED_TOKENS:
-        passthru = re.sub(pattern, replace, passthru)
+    try:
+        return _CONVERTED_PASSTHRU[digest]
+    except KeyError:
+        pass
 
-    return passthru
+    res = _PASSTHRU_TOKENS_RE.sub(_replace_passthru_token, passthru)
+    res = _PASSTHRU_TEXTURE_RE.sub(r"{tex[\1]}", res)
+    if _EXPORT_PASS.is_set():
+        _CONVERTED_PASSTHRU[digest] = res
+    return res
 
 
 # ===========================================================================
@@ -996,6 +1349,42 @@ def _convert_passthru(passthru):
 # ===========================================================================
 
 
+# Set while an export pass is running (see 'export_pass')
+_EXPORT_PASS = threading.Event()
+_EXPORT_PASS_DEPTH = 0  # Nesting depth of running export passes
+_EXPORT_PASS_LOCK = threading.Lock()
+
+
+def _memoize_on_identity(func):
+    """Memoize a one-argument audit function on its argument identity.
+
+    Results are memoized only during an export pass (see 'export_pass'):
+    cache entries hold a reference to the audited object, so that its id
+    cannot be recycled while cached, and document objects must not be kept
+    alive beyond the pass. Cache is emptied by 'clear_cache'.
+    """
+    cache = {}
+
+    @functools.wraps(func)
+    def wrapper(obj):
+        if not _EXPORT_PASS.is_set():
+            return func(obj)
+        try:
+            cached_obj, res = cache[id(obj)]
+        except KeyError:
+            pass
+        else:
+            if cached_obj is obj:
+                return res
+        res = func(obj)
+        cache[id(obj)] = (obj, res)
+        return res
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
+@_memoize_on_identity
 def is_multimat(obj):
     """Check if a material is a multimaterial."""
     try:
@@ -1008,6 +1397,7 @@ def is_multimat(obj):
     return obj is not None and is_app_feature and is_type_multimat
 
 
+@_memoize_on_identity
 def is_valid_material(obj):
     """Assert that an object is a valid Material."""
     try:
@@ -1028,29 +1418,33 @@ def is_valid_material(obj):
 # ===========================================================================
 
 
+@functools.lru_cache(maxsize=1)
 def generate_param_doc():
-    """Generate Markdown documentation from material rendering parameters."""
-    header_fmt = [
-        "#### **{m}** Material",
-        "",
-        "`Render.Type={m}`",
-        "",
-        "Parameter | Type | Default value | Description",
-        "--------- | ---- | ------------- | -----------",
-    ]
+    """Generate Markdown documentation from material rendering parameters.
 
-    line_fmt = "`Render.{m}.{p.name}` | {p.type} | {p.default} | {p.desc}"
-    footer_fmt = [""]
-    lines = []
-    for mat in STD_MATERIALS:
-        lines += [h.format(m=mat) for h in header_fmt]
-        lines += [
-            line_fmt.format(m=mat, p=param)
-            for param in STD_MATERIALS_PARAMETERS[mat]
-        ]
-        lines += footer_fmt
+    As material parameters are static, the result is computed once and
+    cached.
+    """
+    header_fmt = (
+        "#### **{m}** Material\n"
+        "\n"
+        "`Render.Type={m}`\n"
+        "\n"
+        "Parameter | Type | Default value | Description\n"
+        "--------- | ---- | ------------- | -----------\n"
+    )
+    line_fmt = "`Render.{m}.{p.name}` | {p.type} | {p.default} | {p.desc}\n"
 
-    return "\n".join(lines)
+    with io.StringIO() as buffer:
+        write = buffer.write
+        for mat in STD_MATERIALS:
+            write(header_fmt.format(m=mat))
+            for param in STD_MATERIALS_PARAMETERS[mat]:
+                write(line_fmt.format(m=mat, p=param))
+            write("\n")
+        res = buffer.getvalue()
+
+    return res[:-1]  # Strip last newline, like a join
 
 
 def printmat(fcdmat):
@@ -1066,23 +1460,22 @@ def printmat(fcdmat):
         a string containing the material in Material Card format
     """
 
-    def keysort(item):
-        key, _, keyword = item
+    def rank(keyword):
         if keyword == "Type":
-            rank = 0
-        elif keyword in STD_MATERIALS_PARAMETERS:
-            rank = 1
-        else:
-            rank = 2
-        return (rank, key)
+            return 0
+        if keyword in STD_MATERIALS_PARAMETERS:
+            return 1
+        return 2
 
+    # Items are (rank, key, value) tuples, so that they sort directly
+    # (keyword is the token right after 'Render.' prefix)
     items = [
-        (i[0], i[1], i[0].split(".")[1])
-        for i in fcdmat.Material.items()
-        if i[0].startswith("Render.")
+        (rank(key[7:].partition(".")[0]), key, value)
+        for key, value in fcdmat.Material.items()
+        if key.startswith("Render.")
     ]
-    items.sort(key=keysort)
-    lines = [f"{i[0]} = {i[1]}" for i in items]
+    items.sort()
+    lines = [f"{key} = {value}" for _, key, value in items]
     print("\n".join(lines))
 
 
@@ -1096,14 +1489,93 @@ def _get_float(material, param_prefix, param_name, default=0.0):
     return material.get(param_prefix + param_name, default)
 
 
-def passthrough_keys(renderer):
-    """Compute material card keys for passthrough rendering material."""
-    return {f"Render.{renderer}.{i:04}" for i in range(1, 9999)}
+# Maximum number of lines of a passthrough material
+PASSTHROUGH_MAX_LINES = 9998
+
+
+def passthrough_keys(renderer, keys):
+    """Filter material card keys for passthrough rendering material.
+
+    Passthrough keys follow the 'Render.{renderer}.{0001..9998}' pattern.
+
+    Args:
+        renderer -- the targeted renderer (string, case sensitive)
+        keys -- the material card keys to filter (iterable of strings)
+
+    Returns:
+        The sorted list of passthrough keys found in 'keys'
+    """
+    prefix = _render_prefix(renderer)
+    start = len(prefix)
+
+    def _is_passthrough_key(key):
+        suffix = key[start:]
+        return (
+            key.startswith(prefix)
+            and len(suffix) == 4
+            and suffix.isascii()
+            and suffix.isdigit()
+            and 1 <= int(suffix) <= PASSTHROUGH_MAX_LINES
+        )
+
+    return sorted(filter(_is_passthrough_key, keys))
+
+
+def passthrough_lines(renderer, text):
+    """Split a passthrough text into material card lines.
+
+    Lines are numbered following the 'Render.{renderer}.{0001..9998}'
+    pattern. Lines beyond the maximum are dropped, as they could not be read
+    back by 'passthrough_keys'.
+
+    Args:
+        renderer -- the targeted renderer (string, case sensitive)
+        text -- the passthrough text to split
+
+    Returns:
+        A dictionary {material card key: line}
+    """
+    prefix = _render_prefix(renderer)
+    lines = itertools.islice(text.splitlines(), PASSTHROUGH_MAX_LINES)
+    return {f"{prefix}{i:04}": line for i, line in enumerate(lines, 1)}
 
 
 def clear_cache():
-    """Clear functions caches (debug purpose)."""
-    # Remove cache feature (error prone)
+    """Clear functions caches."""
+    _RENDERING_MATERIALS.clear()
+    _TEXTURES_DATA.clear()
+    _materials_by_name.cache_clear()
+    is_multimat.cache_clear()
+    is_valid_material.cache_clear()
+    _CONVERTED_PASSTHRU.clear()
+    _INTERNED_MATERIALS.clear()
+
+
+@contextlib.contextmanager
+def export_pass():
+    """Delimit an export pass (context manager).
+
+    Caches are emptied when entering the pass, as objects may have been
+    modified since last export, and when leaving it, so that they do not keep
+    document objects alive.
+
+    Passes can be nested (a view may be recomputed while a project is
+    rendering): only the outermost pass empties the caches.
+    """
+    global _EXPORT_PASS_DEPTH  # pylint: disable=global-statement
+    with _EXPORT_PASS_LOCK:
+        if not _EXPORT_PASS_DEPTH:
+            clear_cache()
+            _EXPORT_PASS.set()
+        _EXPORT_PASS_DEPTH += 1
+    try:
+        yield
+    finally:
+        with _EXPORT_PASS_LOCK:
+            _EXPORT_PASS_DEPTH -= 1
+            if not _EXPORT_PASS_DEPTH:
+                _EXPORT_PASS.clear()
+                clear_cache()
 
 
 # ===========================================================================
@@ -217,8 +217,9 @@ class RenderMeshBase:
         points, facets = self._originalmesh.Topology
         self._points = [tuple(p) for p in points]
         self._facets = facets
-        self._normals = [tuple(f.Normal) for f in self._originalmesh.Facets]
-        self._areas = [f.Area for f in self._originalmesh.Facets]
+        meshfacets = self._originalmesh.Facets  # Bind once (costly getter)
+        self._normals = [tuple(f.Normal) for f in meshfacets]
+        self._areas = [f.Area for f in meshfacets]
 
     def __del__(self):
         """Finalize RenderMesh.
@@ -531,25 +532,22 @@ class RenderMeshBase:
         mtl = [f"mtllib {mtlfilename}\n\n"] if mtlfilename else []
 
         # Vertices
-        fmtv = functools.partial(str.format, "v {:g} {:g} {:g}\n")
-        verts = (fmtv(*v) for v in self.points)
+        verts = self._format_vectors(self.points, "v %g %g %g\n")
         verts = it.chain(["# Vertices\n"], verts, ["\n"])
 
         # UV
         if self.has_uvmap():
             # Translate, rotate, scale (optionally)
             uvs = self.uvtransform(*uv_transformation)
-            fmtuv = functools.partial(str.format, "vt {:g} {:g}\n")
-            uvs = (fmtuv(t.real, t.imag) for t in uvs)
+            uvs = ((t.real, t.imag) for t in uvs)
+            uvs = self._format_vectors(uvs, "vt %g %g\n")
             uvs = it.chain(["# Texture coordinates\n"], uvs, ["\n"])
         else:
             uvs = []
 
         # Vertex normals
         if self.has_vnormals():
-            norms = self.vnormals
-            fmtn = functools.partial(str.format, "vn {:g} {:g} {:g}\n")
-            norms = (fmtn(*n) for n in norms)
+            norms = self._format_vectors(self.vnormals, "vn %g %g %g\n")
             norms = it.chain(["# Vertex normals\n"], norms, ["\n"])
         else:
             norms = []
@@ -561,22 +559,18 @@ class RenderMeshBase:
         objname.append("\n")
 
         # Faces
+        # (one template per triangle, rather than one per vertex)
         if self.has_vnormals() and self.has_uvmap():
-            mask = " {0}/{0}/{0}"
+            mask = "f {0}/{0}/{0} {1}/{1}/{1} {2}/{2}/{2}\n"
         elif not self.has_vnormals() and self.has_uvmap():
-            mask = " {0}/{0}"
+            mask = "f {0}/{0} {1}/{1} {2}/{2}\n"
         elif self.has_vnormals() and not self.has_uvmap():
-            mask = " {0}//{0}"
+            mask = "f {0}//{0} {1}//{1} {2}//{2}\n"
         else:
-            mask = " {}"
+            mask = "f {0} {1} {2}\n"
 
-        fmtf = functools.partial(str.format, mask)
-        joinf = functools.partial(str.join, "")
-
-        faces = (
-            joinf(["f"] + [fmtf(x + 1) for x in f] + ["\n"])
-            for f in self.facets
-        )
+        fmtf = mask.format
+        faces = (fmtf(i + 1, j + 1, k + 1) for i, j, k in self.facets)
         faces = it.chain(["# Faces\n"], faces)
 
         res = it.chain(header, mtl, verts, uvs, norms, objname, faces)
@@ -666,21 +660,19 @@ class RenderMeshBase:
         ]
 
         # Body - Vertices (and vertex normals and uv)
-        fmt3 = functools.partial(str.format, "{:#g} {:#g} {:#g}")
-        verts = [iter(fmt3(*v) for v in self.points)]
+        verts = [self._format_vectors(self.points, "%#g %#g %#g")]
         if self.has_vnormals():
-            verts += [iter(fmt3(*v) for v in self.vnormals)]
+            verts += [self._format_vectors(self.vnormals, "%#g %#g %#g")]
         if self.has_uvmap():
             # Translate, rotate, scale (optionally)
             uvs = self.uvtransform(uv_translate, uv_rotate, uv_scale)
-            fmt2 = functools.partial(str.format, "{:#g} {:#g}")
-            verts += [iter(fmt2(v.real, v.imag) for v in uvs)]
+            uvs = ((v.real, v.imag) for v in uvs)
+            verts += [self._format_vectors(uvs, "%#g %#g")]
         verts += [it.repeat("\n")]
         verts = (" ".join(v) for v in zip(*verts))
 
         # Body - Faces
-        fmtf = functools.partial(str.format, "3 {} {} {}\n")
-        faces = (fmtf(*v) for v in iter(self.facets))
+        faces = self._format_vectors(self.facets, "3 %d %d %d\n")
 
         # Concat and write
         res = it.chain(header, verts, faces)
@@ -759,60 +751,94 @@ class RenderMeshBase:
         Returns: the name of file that the function wrote.
         """
         # Triangles
-        vrts = [f"<{x:g},{y:g},{z:g}>" for x, y, z in self.points]
-        inds = [f"<{i},{j},{k}>" for i, j, k in self.facets]
-
-        vertices = "\n        ".join(vrts)
-        len_vertices = len(vrts)
-        indices = "\n        ".join(inds)
-        len_indices = len(inds)
+        len_vertices, vertices = self._povfile_vectors(
+            self.points, "<%g,%g,%g>"
+        )
+        len_indices, indices = self._povfile_vectors(self.facets, "<%d,%d,%d>")
 
         # UV map
         if self.has_uvmap():
-            uv_vectors = [f"<{t.real:g},{t.imag:g}>" for t in self.uvmap]
-            len_uv_vectors = len(uv_vectors)
-            uv_vectors = "\n        ".join(uv_vectors)
-            snippet_uv_vects = f"""\
-        uv_vectors {{
-            {len_uv_vectors},
-            {uv_vectors}
-        }}"""
+            len_uv_vectors, uv_vectors = self._povfile_vectors(
+                ((t.real, t.imag) for t in self.uvmap), "<%g,%g>"
+            )
+            snippet_uv_vects = [
+                "        uv_vectors {\n",
+                f"            {len_uv_vectors},\n",
+                "            ",
+                uv_vectors,
+                "\n        }",
+            ]
         else:
-            snippet_uv_vects = ""
+            snippet_uv_vects = []
 
         # Normals
         if self.has_vnormals():
-            nrms = [f"<{nx:g},{ny:g},{nz:g}>" for nx, ny, nz in self.vnormals]
-            normals = "\n        ".join(nrms)
-            len_normals = len(nrms)
-            snippet_normals = f"""\
-        normal_vectors {{
-            {len_normals},
-            {normals}
-        }}"""
+            len_normals, normals = self._povfile_vectors(
+                self.vnormals, "<%g,%g,%g>"
+            )
+            snippet_normals = [
+                "        normal_vectors {\n",
+                f"            {len_normals},\n",
+                "            ",
+                normals,
+                "\n        }",
+            ]
         else:
-            snippet_normals = ""
-
-        snippet = f"""\
-// Generated by FreeCAD-Render
-// Declares object '{name}'
-#declare {name} = mesh2 {{
-    vertex_vectors {{
-        {len_vertices},
-        {vertices}
-    }}
-{snippet_normals}
-{snippet_uv_vects}
-    face_indices {{
-        {len_indices},
-        {indices}
-    }}
-}}  // {name}
-"""
+            snippet_normals = []
+
+        # Gather snippet parts (vectors blocks may be large: they are written
+        # as is, rather than copied into one single string)
+        parts = [
+            "// Generated by FreeCAD-Render\n",
+            f"// Declares object '{name}'\n",
+            f"#declare {name} = mesh2 {{\n",
+            "    vertex_vectors {\n",
+            f"        {len_vertices},\n",
+            "        ",
+            vertices,
+            "\n    }\n",
+            *snippet_normals,
+            "\n",
+            *snippet_uv_vects,
+            "\n",
+            "    face_indices {\n",
+            f"        {len_indices},\n",
+            "        ",
+            indices,
+            "\n    }\n",
+            f"}}  // {name}\n",
+        ]
 
         # Write
         with open(povfile, "w", encoding="utf-8") as f:
-            f.write(snippet)
+            f.writelines(parts)
+
+    @staticmethod
+    def _format_vectors(vectors, fmt):
+        """Format vectors with a printf-style template, one by one (iterator).
+
+        Args:
+            vectors -- the vectors to format (iterable of tuples)
+            fmt -- the printf-style format of a vector (str)
+        """
+        return (fmt % v for v in vectors)
+
+    @staticmethod
+    def _povfile_vectors(vectors, fmt):
+        """Format vectors for a Povray file, one vector per line.
+
+        Args:
+            vectors -- the vectors to format (iterable of tuples)
+            fmt -- the printf-style format of a vector (str)
+
+        Returns: the number of vectors and the formatted vectors (str)
+        """
+        # Format all vectors components at once, with a repeated template,
+        # rather than building one string per vector
+        components = tuple(it.chain.from_iterable(vectors))
+        count = len(components) // fmt.count("%")
+        template = "\n        ".join(it.repeat(fmt, count))
+        return count, template % components
 
     ##########################################################################
     #                               UV manipulations                         #
@@ -952,8 +978,9 @@ class RenderMeshBase:
         points = [tuple(p) for p in points]
         self.points = points
         self.facets = facets
-        self.normals = [tuple(f.Normal) for f in iter(mesh.Facets)]
-        self.areas = [f.Area for f in iter(mesh.Facets)]
+        meshfacets = mesh.Facets
+        self.normals = [tuple(f.Normal) for f in meshfacets]
+        self.areas = [f.Area for f in meshfacets]
         self.uvmap = uvmap
 
     def _compute_uvmap_sphere(self):
@@ -1006,8 +1033,9 @@ class RenderMeshBase:
         points, facets = tuple(mesh.Topology)
         self.points = [tuple(p) for p in points]
         self.facets = facets
-        self.normals = [tuple(f.Normal) for f in iter(mesh.Facets)]
-        self.areas = [f.Area for f in iter(mesh.Facets)]
+        meshfacets = mesh.Facets
+        self.normals = [tuple(f.Normal) for f in meshfacets]
+        self.areas = [f.Area for f in meshfacets]
         self.uvmap = uvmap
 
     def _compute_uvmap_cube(self):
@@ -1049,8 +1077,9 @@ class RenderMeshBase:
         points = [tuple(p) for p in points]
         self.points = points
         self.facets = facets
-        self.normals = [tuple(f.Normal) for f in iter(mesh.Facets)]
-        self.areas = [f.Area for f in iter(mesh.Facets)]
+        meshfacets = mesh.Facets
+        self.normals = [tuple(f.Normal) for f in meshfacets]
+        self.areas = [f.Area for f in meshfacets]
         self.uvmap = uvmap
 
     def _make_uvmap_positive(self):
@@ -82,6 +82,7 @@ from Render.rendermaterial import (
     STD_MATERIALS_PARAMETERS,
     is_valid_material,
     passthrough_keys,
+    passthrough_lines,
 )
 from Render.texture import str2imageid, str2imageid_ext
 
@@ -663,8 +664,6 @@ class MaterialSettingsTaskPanel:
         text = self.passthru.toPlainText()
         self.passthru_cache[rdr.text()] = text
 
-    PASSTHROUGH_KEYS = {r: passthrough_keys(r) for r in VALID_RENDERERS}
-
     def _populate_passthru(self, renderer, material):
         """Populate passthrough edit field."""
         # If no renderer or no material provided, disable field and quit
@@ -680,9 +679,8 @@ class MaterialSettingsTaskPanel:
         try:
             text = self.passthru_cache[renderer]
         except KeyError:
-            keys = self.PASSTHROUGH_KEYS[renderer]
-            common_keys = keys & material.Material.keys()
-            lines = [material.Material[k] for k in sorted(common_keys)]
+            mat = material.Material
+            lines = [mat[k] for k in passthrough_keys(renderer, mat.keys())]
             text = "\n".join(lines)
 
         self.passthru.setPlainText(text)
@@ -857,14 +855,12 @@ class MaterialSettingsTaskPanel:
                 tmp_mat[param_name] = str(get_value())
 
         # Set passthru
-        pthr_keys = self.PASSTHROUGH_KEYS
         for rdr, text in self.passthru_cache.items():
             # Clear existing lines for rdr
-            for key in pthr_keys[rdr]:
+            for key in passthrough_keys(rdr, tmp_mat.keys()):
                 tmp_mat.pop(key, None)
             # Fill with new lines for rdr
-            lines = dict(zip(sorted(pthr_keys[rdr]), text.splitlines()))
-            tmp_mat.update(lines)
+            tmp_mat.update(passthrough_lines(rdr, text))
 
         # Set ForceUVMap
         force_uvmap = str(self.force_uvmap.isChecked())
@@ -40,6 +40,8 @@ import PySide2
 import FreeCAD as App
 import FreeCADGui as Gui
 
+from Render.constants import PARAMS
+
 try:
     if not App.GuiUp:
         # assembly3 needs Gui...
@@ -315,9 +317,8 @@ def set_dryrun(state):
     Args:
         state -- state to set dry run (boolean)
     """
-    params = App.ParamGet("User parameter:BaseApp/Preferences/Mod/Render")
     state = bool(state)
-    params.SetBool("DryRun", state)
+    PARAMS.SetBool("DryRun", state)
     msg = (
         "[Render][Debug] Dry run is on\n"
         if state
@@ -338,9 +339,8 @@ def set_debug(state):
     Args:
         state -- state to set debug (boolean)
     """
-    params = App.ParamGet("User parameter:BaseApp/Preferences/Mod/Render")
     state = bool(state)
-    params.SetBool("Debug", state)
+    PARAMS.SetBool("Debug", state)
     msg = (
         "[Render][Debug] Debug is on\n"
         if state
@@ -361,9 +361,8 @@ def set_memcheck(state):
     Args:
         state -- state to set memory checking (boolean)
     """
-    params = App.ParamGet("User parameter:BaseApp/Preferences/Mod/Render")
     state = bool(state)
-    params.SetBool("Memcheck", state)
+    PARAMS.SetBool("Memcheck", state)
     msg = (
         "[Render][Debug] Memcheck is on\n"
         if state
@@ -384,9 +383,8 @@ def set_a2p(state):
     Args:
         state -- state to set a2p support (boolean)
     """
-    params = App.ParamGet("User parameter:BaseApp/Preferences/Mod/Render")
     state = bool(state)
-    params.SetBool("A2p", state)
+    PARAMS.SetBool("A2p", state)
     msg = (
         "[Render][Debug] A2plus support is on\n"
         if state
@@ -397,22 +395,19 @@ def set_a2p(state):
 
 def get_a2p():
     """Get A2plus support status."""
-    params = App.ParamGet("User parameter:BaseApp/Preferences/Mod/Render")
-    return params.GetBool("A2p")
+    return PARAMS.GetBool("A2p")
 
 
 def last_cmd():
     """Return last executed renderer command (debug purpose)."""
-    params = App.ParamGet("User parameter:BaseApp/Preferences/Mod/Render")
-    last_cmd_cache = params.GetString("LastCommand")
+    last_cmd_cache = PARAMS.GetString("LastCommand")
     return last_cmd_cache
 
 
 def set_last_cmd(cmd):
     """Set last executed renderer command."""
     cmd = str(cmd)
-    params = App.ParamGet("User parameter:BaseApp/Preferences/Mod/Render")
-    params.SetString("LastCommand", cmd)
+    PARAMS.SetString("LastCommand", cmd)
 
 
 def clear_report_view():
@@ -33,6 +33,7 @@ from PySide.QtCore import QT_TRANSLATE_NOOP
 from Render.constants import FCDVERSION
 from Render.base import FeatureBase, Prop, ViewProviderBase
 from Render.rdrhandler import RendererHandler
+from Render import rendermaterial
 
 
 class View(FeatureBase):
@@ -161,7 +162,9 @@ class View(FeatureBase):
             transparency_boost=proj.TransparencySensitivity,
         )
 
-        obj.ViewResult = renderer.get_rendering_string(obj)
+        # Export in a pass, so that materials caches are scoped to it
+        with rendermaterial.export_pass():
+            obj.ViewResult = renderer.get_rendering_string(obj)
 
     @staticmethod
     def view_label(obj, proj, is_group=False):